@@ -6,9 +6,21 @@ Various types of line graphs and plotting techniques
 
 import matplotlib.pyplot as plt
 import numpy as np
-from datetime import datetime, timedelta
 
-def basic_line_graph():
+def _get_axes(ax, figsize):
+    """Return ax and whether the caller owns the figure, creating one if needed"""
+    if ax is not None:
+        return ax, False
+    _, ax = plt.subplots(figsize=figsize)
+    return ax, True
+
+def _finish(ax, owns_figure):
+    """Lay out and show the figure if the demo created it"""
+    if owns_figure:
+        ax.figure.tight_layout()
+        plt.show()
+
+def basic_line_graph(ax=None):
     """Create a basic line graph"""
     print("Creating basic line graph...")
     
@@ -16,105 +28,107 @@ def basic_line_graph():
     x = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     y = [2, 4, 6, 8, 10, 12, 14, 16, 18, 20]
     
-    plt.figure(figsize=(10, 6))
-    plt.plot(x, y, marker='o', linewidth=2, markersize=6)
-    plt.title('Basic Line Graph - Linear Growth')
-    plt.xlabel('X Values')
-    plt.ylabel('Y Values')
-    plt.grid(True, alpha=0.3)
-    plt.show()
+    ax, owns_figure = _get_axes(ax, (10, 6))
+    ax.plot(x, y, marker='o', linewidth=2, markersize=6)
+    ax.set_title('Basic Line Graph - Linear Growth')
+    ax.set_xlabel('X Values')
+    ax.set_ylabel('Y Values')
+    ax.grid(True, alpha=0.3)
+    _finish(ax, owns_figure)
 
-def multiple_lines():
+def multiple_lines(ax=None):
     """Create graph with multiple lines"""
     print("Creating multiple line graph...")
     
     x = np.linspace(0, 10, 50)
     y1 = np.sin(x)
     y2 = np.cos(x)
-    y3 = np.sin(x) * np.cos(x)
-    
-    plt.figure(figsize=(12, 8))
-    plt.plot(x, y1, label='sin(x)', linewidth=2, color='blue')
-    plt.plot(x, y2, label='cos(x)', linewidth=2, color='red')
-    plt.plot(x, y3, label='sin(x) * cos(x)', linewidth=2, color='green')
-    
-    plt.title('Multiple Line Graph - Trigonometric Functions')
-    plt.xlabel('X Values (radians)')
-    plt.ylabel('Y Values')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.show()
+    y3 = y1 * y2
+    
+    ax, owns_figure = _get_axes(ax, (12, 8))
+    ax.plot(x, y1, label='sin(x)', linewidth=2, color='blue')
+    ax.plot(x, y2, label='cos(x)', linewidth=2, color='red')
+    ax.plot(x, y3, label='sin(x) * cos(x)', linewidth=2, color='green')
+    
+    ax.set_title('Multiple Line Graph - Trigonometric Functions')
+    ax.set_xlabel('X Values (radians)')
+    ax.set_ylabel('Y Values')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    _finish(ax, owns_figure)
 
-def styled_line_graph():
+def styled_line_graph(ax=None):
     """Create a styled line graph with different line styles"""
     print("Creating styled line graph...")
     
     x = np.linspace(0, 20, 100)
-    y1 = np.exp(-x/10) * np.cos(x)
-    y2 = np.exp(-x/10) * np.sin(x)
-    y3 = np.exp(-x/10)
-    y4 = -np.exp(-x/10)
+    envelope = np.exp(-x/10)
+    y1 = envelope * np.cos(x)
+    y2 = envelope * np.sin(x)
+    y3 = envelope
+    y4 = -envelope
     
-    plt.figure(figsize=(14, 8))
+    ax, owns_figure = _get_axes(ax, (14, 8))
     
-    plt.plot(x, y1, '--', label='Damped Cosine', linewidth=2, color='purple')
-    plt.plot(x, y2, '-.', label='Damped Sine', linewidth=2, color='orange')
-    plt.plot(x, y3, ':', label='Exponential Decay', linewidth=3, color='red')
-    plt.plot(x, y4, ':', linewidth=3, color='red', alpha=0.7)
+    ax.plot(x, y1, '--', label='Damped Cosine', linewidth=2, color='purple')
+    ax.plot(x, y2, '-.', label='Damped Sine', linewidth=2, color='orange')
+    ax.plot(x, y3, ':', label='Exponential Decay', linewidth=3, color='red')
+    ax.plot(x, y4, ':', linewidth=3, color='red', alpha=0.7)
     
-    plt.title('Styled Line Graph - Damped Oscillations', fontsize=16, fontweight='bold')
-    plt.xlabel('Time', fontsize=12)
-    plt.ylabel('Amplitude', fontsize=12)
-    plt.legend(fontsize=11)
-    plt.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+    ax.set_title('Styled Line Graph - Damped Oscillations', fontsize=16, fontweight='bold')
+    ax.set_xlabel('Time', fontsize=12)
+    ax.set_ylabel('Amplitude', fontsize=12)
+    ax.legend(fontsize=11)
+    ax.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
     
     # Add shaded region
-    plt.fill_between(x, y3, y4, alpha=0.2, color='red', label='Envelope')
+    ax.fill_between(x, y3, y4, alpha=0.2, color='red', label='Envelope')
     
-    plt.tight_layout()
-    plt.show()
+    _finish(ax, owns_figure)
 
-def time_series_graph():
+def time_series_graph(ax=None):
     """Create a time series line graph"""
     print("Creating time series graph...")
     
     # Generate time data
-    start_date = datetime(2024, 1, 1)
-    dates = [start_date + timedelta(days=i) for i in range(365)]
+    dates = np.arange('2024-01-01', '2024-12-31', dtype='datetime64[D]')
     
     # Generate sample data (temperature over year)
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     base_temp = 20 + 15 * np.sin(2 * np.pi * np.arange(365) / 365)  # Seasonal variation
-    daily_variation = np.random.normal(0, 3, 365)  # Daily randomness
+    daily_variation = rng.normal(0, 3, 365)  # Daily randomness
     temperatures = base_temp + daily_variation
     
-    plt.figure(figsize=(15, 8))
-    plt.plot(dates, temperatures, linewidth=1, color='steelblue', alpha=0.7)
+    ax, owns_figure = _get_axes(ax, (15, 8))
+    ax.plot(dates, temperatures, linewidth=1, color='steelblue', alpha=0.7)
     
-    # Add trend line
-    z = np.polyfit(range(365), temperatures, 1)
-    p = np.poly1d(z)
-    plt.plot(dates, p(range(365)), "r--", linewidth=2, label=f'Trend: {z[0]:.3f}°C/day')
+    # Add trend line (closed-form least squares for a straight line)
+    days = np.arange(365)
+    days_centered = days - days.mean()
+    slope = (days_centered * (temperatures - temperatures.mean())).sum() / (days_centered ** 2).sum()
+    intercept = temperatures.mean() - slope * days.mean()
+    ax.plot(dates, slope * days + intercept, "r--", linewidth=2, label=f'Trend: {slope:.3f}°C/day')
     
-    plt.title('Time Series - Daily Temperature Throughout 2024', fontsize=16)
-    plt.xlabel('Date', fontsize=12)
-    plt.ylabel('Temperature (°C)', fontsize=12)
-    plt.legend()
-    plt.grid(True, alpha=0.3)
+    ax.set_title('Time Series - Daily Temperature Throughout 2024', fontsize=16)
+    ax.set_xlabel('Date', fontsize=12)
+    ax.set_ylabel('Temperature (°C)', fontsize=12)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
     
     # Format x-axis
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.show()
+    ax.tick_params(axis='x', labelrotation=45)
+    _finish(ax, owns_figure)
 
-def subplot_line_graphs():
+def subplot_line_graphs(axes=None):
     """Create multiple subplots with different line graphs"""
     print("Creating subplot line graphs...")
     
     # Data for different plots
     x = np.linspace(0, 10, 100)
     
-    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+    owns_figure = axes is None
+    if owns_figure:
+        _, axes = plt.subplots(2, 2, figsize=(15, 10))
     
     # Plot 1: Polynomial functions
     axes[0, 0].plot(x, x**2, label='x²', linewidth=2)
@@ -131,20 +145,46 @@ def subplot_line_graphs():
     axes[0, 1].grid(True, alpha=0.3)
     
     # Plot 3: Random walk
-    np.random.seed(42)
-    steps = np.random.choice([-1, 1], size=100)
+    rng = np.random.default_rng(42)
+    bits = rng.integers(0, 2, size=100, dtype=np.int8)
+    steps = (bits << 1) - 1
     walk = np.cumsum(steps)
     axes[1, 0].plot(range(100), walk, linewidth=2, color='purple')
     axes[1, 0].set_title('Random Walk')
     axes[1, 0].grid(True, alpha=0.3)
     
     # Plot 4: Stock-like data
-    np.random.seed(42)
-    price = 100
-    prices = [price]
-    for _ in range(99):
-        price *= (1 + np.random.normal(0, 0.02))
-        prices.append(price)
+    rng = np.random.default_rng(42)
+    returns = rng.normal(0, 0.02, 99)
+    prices = np.empty(100)
+    prices[0] = 1.0
+    np.cumprod(1 + returns, out=prices[1:])
+    prices *= 100
     
     axes[1, 1].plot(range(100), prices, linewidth=2, color='darkgreen')
-    axes
+    axes[1, 1].set_title('Stock-like Price Movement')
+    axes[1, 1].grid(True, alpha=0.3)
+    
+    _finish(axes[0, 0], owns_figure)
+
+def main():
+    """Main function to run all demonstrations"""
+    print("Matplotlib Line Graph Demonstration")
+    print("=" * 50)
+    
+    # Draw every demo into one preallocated figure instead of creating and
+    # tearing down a figure per demo
+    fig, axes = plt.subplots(4, 2, figsize=(16, 22))
+    basic_line_graph(axes[0, 0])
+    multiple_lines(axes[0, 1])
+    styled_line_graph(axes[1, 0])
+    time_series_graph(axes[1, 1])
+    subplot_line_graphs(axes[2:, :])
+    
+    fig.tight_layout()
+    plt.show()
+    
+    print("\nLine graph demonstration completed!")
+
+if __name__ == "__main__":
+    main()
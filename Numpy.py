@@ -34,7 +34,7 @@ def matrix_operations():
     
     # Create 2D arrays
     matrix1 = np.array([[1, 2, 3], [4, 5, 6]])
-    matrix2 = np.random.randint(1, 10, (3, 2))
+    matrix2 = np.random.default_rng().integers(1, 10, (3, 2))
     
     print(f"Matrix 1:\n{matrix1}")
     print(f"Matrix 2:\n{matrix2}")
@@ -52,8 +52,8 @@ def statistical_analysis():
     print("\n=== Statistical Analysis ===")
     
     # Generate random data
-    np.random.seed(42)  # For reproducibility
-    data = np.random.normal(100, 15, 1000)  # Normal distribution
+    rng = np.random.default_rng(42)  # For reproducibility
+    data = rng.normal(100, 15, 1000)  # Normal distribution
     
     print(f"Dataset size: {len(data)}")
     print(f"Mean: {np.mean(data):.2f}")
@@ -8,26 +8,46 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 
+# Ordered label types, shared by the builders and the CSV loader
+PERFORMANCE_RATING_DTYPE = pd.CategoricalDtype(['Poor', 'Average', 'Good', 'Excellent'], ordered=True)
+SALARY_CATEGORY_DTYPE = pd.CategoricalDtype(['Low', 'Medium', 'High', 'Very High'], ordered=True)
+AGE_GROUP_DTYPE = pd.CategoricalDtype(['Young', 'Middle', 'Senior'], ordered=True)
+
 def create_sample_data():
     """Create sample data for demonstration"""
     print("=== Creating Sample Dataset ===")
     
     # Create sample employee data
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n_employees = 100
     
+    # Draw salaries in place and round them before the integer cast
+    salary = np.empty(n_employees)
+    rng.standard_normal(out=salary)
+    salary *= 15000
+    salary += 60000
+    np.rint(salary, out=salary)
+    
     data = {
         'employee_id': range(1, n_employees + 1),
         'name': [f'Employee_{i}' for i in range(1, n_employees + 1)],
-        'department': np.random.choice(['IT', 'Finance', 'HR', 'Marketing', 'Sales'], n_employees),
-        'age': np.random.randint(22, 65, n_employees),
-        'salary': np.random.normal(60000, 15000, n_employees).astype(int),
-        'years_experience': np.random.randint(0, 20, n_employees),
-        'performance_rating': np.random.choice(['Poor', 'Average', 'Good', 'Excellent'], 
+        'department': rng.choice(['IT', 'Finance', 'HR', 'Marketing', 'Sales'], n_employees),
+        'age': rng.integers(22, 65, n_employees),
+        'salary': salary.astype(np.int32),
+        'years_experience': rng.integers(0, 20, n_employees),
+        'performance_rating': rng.choice(['Poor', 'Average', 'Good', 'Excellent'], 
                                              n_employees, p=[0.1, 0.3, 0.4, 0.2])
     }
     
-    df = pd.DataFrame(data)
+    # Narrow integer columns and store the repeated labels as categories
+    df = pd.DataFrame(data).astype({
+        'employee_id': 'int32',
+        'age': 'int8',
+        'salary': 'int32',
+        'years_experience': 'int8',
+        'department': 'category',
+        'performance_rating': PERFORMANCE_RATING_DTYPE
+    })
     print(f"Created dataset with {len(df)} employees")
     print(f"Columns: {list(df.columns)}")
     
@@ -59,7 +79,7 @@ def data_analysis_operations(df):
     print("\n=== Data Analysis Operations ===")
     
     # Group by operations
-    dept_stats = df.groupby('department').agg({
+    dept_stats = df.groupby('department', observed=True).agg({
         'salary': ['mean', 'min', 'max', 'count'],
         'age': 'mean',
         'years_experience': 'mean'
@@ -68,30 +88,29 @@ def data_analysis_operations(df):
     print("Department statistics:")
     print(dept_stats)
     
-    # Value counts
+    # Value counts (categorical columns count their codes; listed in category order)
     print(f"\nDepartment distribution:")
-    print(df['department'].value_counts())
+    print(df['department'].value_counts(sort=False))
     
     print(f"\nPerformance rating distribution:")
-    print(df['performance_rating'].value_counts())
+    print(df['performance_rating'].value_counts(sort=False))
     
     # Correlation analysis
     print(f"\nCorrelation between salary and experience:")
-    correlation = df['salary'].corr(df['years_experience'])
+    correlation = np.corrcoef(df['salary'].to_numpy(), df['years_experience'].to_numpy())[0, 1]
     print(f"{correlation:.3f}")
 
 def data_manipulation(df):
     """Demonstrate data manipulation techniques"""
     print("\n=== Data Manipulation ===")
     
-    # Create new columns
-    df['salary_category'] = pd.cut(df['salary'], 
-                                  bins=[0, 50000, 65000, 80000, float('inf')],
-                                  labels=['Low', 'Medium', 'High', 'Very High'])
+    # Create new columns (searchsorted on the inner bin edges gives the same
+    # right-inclusive bins as pd.cut without building an IntervalIndex)
+    salary_codes = np.searchsorted([50000, 65000, 80000], df['salary'].to_numpy())
+    df['salary_category'] = pd.Categorical.from_codes(salary_codes, dtype=SALARY_CATEGORY_DTYPE)
     
-    df['age_group'] = pd.cut(df['age'], 
-                            bins=[0, 30, 45, 65],
-                            labels=['Young', 'Middle', 'Senior'])
+    age_codes = np.searchsorted([30, 45], df['age'].to_numpy())
+    df['age_group'] = pd.Categorical.from_codes(age_codes, dtype=AGE_GROUP_DTYPE)
     
     print("Added new categorical columns:")
     print(df[['name', 'salary', 'salary_category', 'age', 'age_group']].head())
@@ -107,11 +126,22 @@ def save_and_load_csv(df):
     
     # Save to CSV
     filename = 'employee_data.csv'
-    df.to_csv(filename, index=False)
+    df.to_csv(filename, index=False, chunksize=10_000)
     print(f"Data saved to {filename}")
     
-    # Load from CSV
-    loaded_df = pd.read_csv(filename)
+    # Load from CSV with explicit dtypes so pandas skips type inference
+    dtypes = {
+        'employee_id': 'int32',
+        'name': 'string',
+        'department': 'category',
+        'age': 'int8',
+        'salary': 'int32',
+        'years_experience': 'int8',
+        'performance_rating': PERFORMANCE_RATING_DTYPE,
+        'salary_category': SALARY_CATEGORY_DTYPE,
+        'age_group': AGE_GROUP_DTYPE
+    }
+    loaded_df = pd.read_csv(filename, engine='c', dtype=dtypes)
     print(f"Loaded data shape: {loaded_df.shape}")
     
     # Show first few rows of loaded data
@@ -159,7 +189,8 @@ def advanced_operations(df):
         index='department',
         columns='performance_rating',
         aggfunc='mean',
-        fill_value=0
+        fill_value=0,
+        observed=True
     ).round(0)
     
     print("Salary pivot table (Department vs Performance):")
@@ -172,9 +203,8 @@ def advanced_operations(df):
     print(f"\nMissing values created: {df_copy['salary'].isna().sum()}")
     print("Filling missing values with department mean...")
     
-    df_copy['salary'] = df_copy.groupby('department')['salary'].transform(
-        lambda x: x.fillna(x.mean())
-    )
+    dept_means = df_copy.groupby('department', observed=True)['salary'].transform('mean')
+    df_copy['salary'] = df_copy['salary'].fillna(dept_means)
     
     print(f"Missing values after filling: {df_copy['salary'].isna().sum()}")
 
@@ -5,18 +5,184 @@ HTTP requests, API interactions, and web scraping basics
 """
 
 import requests
+import urllib3
 import json
 import time
-from urllib.parse import urljoin
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+try:
+    from requests_cache import CachedSession, DO_NOT_CACHE
+except ImportError:  # requests-cache is optional; fall back to an uncached session
+    CachedSession = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to response.json()
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; arrays are decoded whole instead
+    ijson = None
+
+def parse_json(response):
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        # Keep raising the requests error type the demos already catch
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+def iter_json_array(response):
+    """Iterate over a JSON array response, streaming items when ijson is installed"""
+    # Responses from a CachedSession (hits and misses alike) carry from_cache;
+    # requests-cache reads their whole body, so there is no stream left
+    if ijson is None or hasattr(response, 'from_cache'):
+        yield from parse_json(response)
+        return
+    
+    response.raw.decode_content = True  # Let urllib3 undo gzip/deflate
+    try:
+        yield from ijson.items(response.raw, 'item')
+    except ijson.JSONError as e:
+        raise requests.exceptions.JSONDecodeError(str(e), '', 0) from e
+    except urllib3.exceptions.ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e) from e
+    except urllib3.exceptions.DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e) from e
+    except urllib3.exceptions.ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e) from e
+
+# The JSON POST body never changes, so encode it once at import
+JSON_POST_DATA = {
+    'user_id': 123,
+    'preferences': {
+        'theme': 'dark',
+        'language': 'en'
+    },
+    'active': True
+}
+if orjson is not None:
+    JSON_POST_BODY = orjson.dumps(JSON_POST_DATA)
+else:
+    JSON_POST_BODY = json.dumps(JSON_POST_DATA).encode('utf-8')
+
+class TunedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets disable Nagle's algorithm and use TCP keepalive"""
+    
+    # urllib3's defaults already include TCP_NODELAY; keep them and add
+    # SO_KEEPALIVE so idle pooled connections stay healthy between demos
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+class TokenBucket:
+    """Token-bucket rate limiter allowing bursts up to capacity, refilled at rpm / 60 tokens per second"""
+    
+    def __init__(self, rpm, capacity=None):
+        self.r = rpm / 60
+        self.capacity = capacity if capacity is not None else rpm
+        self.request_tokens = self.capacity
+        self.last_update = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping only as long as it takes to refill one"""
+        with self.lock:
+            now = time.monotonic()
+            elapsed = now - self.last_update
+            self.request_tokens = min(self.capacity, self.request_tokens + elapsed * self.r)
+            self.last_update = now
+            
+            if self.request_tokens < 1:
+                # Waiters queue on the lock, so they are released in order
+                time.sleep((1 - self.request_tokens) / self.r)
+                self.request_tokens = 1
+                self.last_update = time.monotonic()
+            
+            self.request_tokens -= 1
+
+# Hosts contacted by the demos
+DEMO_HOSTS = ('httpbin.org', 'jsonplaceholder.typicode.com')
 
 class APIExplorer:
     """Class to demonstrate various requests operations"""
     
     def __init__(self):
-        self.session = requests.Session()
+        if CachedSession is not None:
+            # Serve repeated GETs for JSONPlaceholder's fixed data from a
+            # local SQLite cache. httpbin echoes each request and times
+            # /delay, so it always goes to the network, as do POSTs.
+            self.session = CachedSession(
+                'demo_cache',
+                backend='sqlite',
+                urls_expire_after={
+                    'jsonplaceholder.typicode.com': 3600,
+                    '*': DO_NOT_CACHE
+                },
+                allowable_methods=('GET',)
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Python-Requests-Demo/1.0'
         })
+        
+        # Keep enough pooled connections per host and retry transient
+        # server errors with backoff instead of failing the demo outright.
+        # Read timeouts are not retried so they still surface as Timeout.
+        retry = Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'POST'])
+        )
+        adapter = TunedHTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Pace requests without fixed sleeps; bursts pass straight through
+        self.limiter = TokenBucket(rpm=120)
+        
+        self.prime_dns()
+    
+    def get(self, url, **kwargs):
+        """Send a rate-limited GET through the session"""
+        self.limiter.acquire()
+        return self.session.get(url, **kwargs)
+    
+    def post(self, url, **kwargs):
+        """Send a rate-limited POST through the session"""
+        self.limiter.acquire()
+        return self.session.post(url, **kwargs)
+    
+    def prime_dns(self):
+        """Resolve the demo hosts up front so the first requests don't wait on DNS"""
+        # This only saves time on later lookups when the system resolver
+        # caches answers (e.g. systemd-resolved or nscd)
+        for host in DEMO_HOSTS:
+            try:
+                socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+            except OSError:
+                pass  # The demo that uses this host will report the failure
+    
+    def clear_cache(self):
+        """Drop cached responses so the next demos hit the network again"""
+        if CachedSession is not None:
+            self.session.cache.clear()
     
     def basic_get_request(self):
         """Demonstrate basic GET request"""
@@ -24,11 +190,17 @@ class APIExplorer:
         
         try:
             url = "https://httpbin.org/get"
-            response = self.session.get(url)
+            response = self.get(url)
             
             print(f"URL: {url}")
             print(f"Status Code: {response.status_code}")
-            print(f"Response Headers: {dict(response.headers)}")
+            print("Response Headers:")
+            # Content-Encoding shows the compression negotiated from the
+            # session's Accept-Encoding (br is offered when brotli is installed)
+            for key in ('Content-Type', 'Content-Encoding', 'Content-Length', 'Server', 'Date'):
+                value = response.headers.get(key)
+                if value:
+                    print(f"  {key}: {value}")
             print(f"Response Content (first 200 chars):")
             print(response.text[:200] + "...")
             
@@ -47,8 +219,8 @@ class APIExplorer:
                 'version': '2.31'
             }
             
-            response = self.session.get(url, params=params)
-            data = response.json()
+            response = self.get(url, params=params)
+            data = parse_json(response)
             
             print(f"Request URL: {response.url}")
             print(f"Parameters sent: {data.get('args', {})}")
@@ -56,20 +228,29 @@ class APIExplorer:
         except requests.exceptions.RequestException as e:
             print(f"Error: {e}")
     
-    def post_request_demo(self):
+    def send_form_post(self):
+        """Send the form-encoded POST used by post_request_demo"""
+        url = "https://httpbin.org/post"
+        data = {
+            'username': 'demo_user',
+            'email': 'demo@example.com',
+            'message': 'Hello from Python requests!'
+        }
+        return self.post(url, data=data)
+    
+    def send_json_post(self):
+        """Send the JSON POST used by json_post_request"""
+        url = "https://httpbin.org/post"
+        headers = {'Content-Type': 'application/json'}
+        return self.post(url, data=JSON_POST_BODY, headers=headers)
+    
+    def post_request_demo(self, pending=None):
         """Demonstrate POST request with data"""
         print("\n=== POST Request Demo ===")
         
         try:
-            url = "https://httpbin.org/post"
-            data = {
-                'username': 'demo_user',
-                'email': 'demo@example.com',
-                'message': 'Hello from Python requests!'
-            }
-            
-            response = self.session.post(url, data=data)
-            result = response.json()
+            response = pending.result() if pending else self.send_form_post()  # pending: a request post_demos already sent
+            result = parse_json(response)
             
             print(f"Status Code: {response.status_code}")
             print(f"Form data sent: {result.get('form', {})}")
@@ -77,23 +258,13 @@ class APIExplorer:
         except requests.exceptions.RequestException as e:
             print(f"Error: {e}")
     
-    def json_post_request(self):
+    def json_post_request(self, pending=None):
         """Demonstrate POST request with JSON data"""
         print("\n=== JSON POST Request ===")
         
         try:
-            url = "https://httpbin.org/post"
-            json_data = {
-                'user_id': 123,
-                'preferences': {
-                    'theme': 'dark',
-                    'language': 'en'
-                },
-                'active': True
-            }
-            
-            response = self.session.post(url, json=json_data)
-            result = response.json()
+            response = pending.result() if pending else self.send_json_post()  # pending: a request post_demos already sent
+            result = parse_json(response)
             
             print(f"Status Code: {response.status_code}")
             print(f"JSON data sent: {result.get('json', {})}")
@@ -102,6 +273,14 @@ class APIExplorer:
         except requests.exceptions.RequestException as e:
             print(f"Error: {e}")
     
+    def post_demos(self):
+        """Run both POST demos with their requests in flight together"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            form_post = executor.submit(self.send_form_post)
+            json_post = executor.submit(self.send_json_post)
+            self.post_request_demo(form_post)
+            self.json_post_request(json_post)
+    
     def headers_and_auth_demo(self):
         """Demonstrate custom headers and authentication"""
         print("\n=== Headers and Authentication Demo ===")
@@ -114,8 +293,8 @@ class APIExplorer:
                 'Accept': 'application/json'
             }
             
-            response = self.session.get(url, headers=custom_headers)
-            result = response.json()
+            response = self.get(url, headers=custom_headers)
+            result = parse_json(response)
             
             print(f"Custom headers sent:")
             sent_headers = result.get('headers', {})
@@ -126,11 +305,11 @@ class APIExplorer:
             # Basic auth demo
             print("\nBasic Authentication Demo:")
             auth_url = "https://httpbin.org/basic-auth/demo/password"
-            auth_response = self.session.get(auth_url, auth=('demo', 'password'))
+            auth_response = self.get(auth_url, auth=('demo', 'password'))
             
             if auth_response.status_code == 200:
                 print("✓ Authentication successful")
-                print(f"Response: {auth_response.json()}")
+                print(f"Response: {parse_json(auth_response)}")
             else:
                 print(f"✗ Authentication failed: {auth_response.status_code}")
                 
@@ -144,7 +323,7 @@ class APIExplorer:
         # Timeout demo
         try:
             print("Testing timeout (3 seconds)...")
-            response = self.session.get("https://httpbin.org/delay/2", timeout=3)
+            response = self.get("https://httpbin.org/delay/2", timeout=3)
             print(f"✓ Request completed: {response.status_code}")
         except requests.exceptions.Timeout:
             print("✗ Request timed out")
@@ -154,7 +333,7 @@ class APIExplorer:
         # Error status codes
         try:
             print("\nTesting 404 error handling...")
-            response = self.session.get("https://httpbin.org/status/404")
+            response = self.get("https://httpbin.org/status/404")
             response.raise_for_status()  # Will raise an exception
         except requests.exceptions.HTTPError as e:
             print(f"✓ HTTP Error caught: {e}")
@@ -166,29 +345,39 @@ class APIExplorer:
         print("\n=== Public API Demo ===")
         
         try:
-            # JSONPlaceholder API
-            print("Fetching posts from JSONPlaceholder...")
+            # JSONPlaceholder API; the posts and user requests are
+            # independent, so fetch both at once
+            print("Fetching posts and user info from JSONPlaceholder...")
             posts_url = "https://jsonplaceholder.typicode.com/posts"
-            response = self.session.get(posts_url)
+            user_url = "https://jsonplaceholder.typicode.com/users/1"
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Only 3 posts are shown, so ask for just those; the server
+                # reports the full count in X-Total-Count. Stream the body
+                # unless requests-cache will read all of it to store it
+                posts_future = executor.submit(self.get, posts_url, params={'_limit': 3},
+                                               stream=CachedSession is None)
+                user_future = executor.submit(self.get, user_url)
+                response = posts_future.result()
+                user_response = user_future.result()
             
             if response.status_code == 200:
-                posts = response.json()
-                print(f"✓ Retrieved {len(posts)} posts")
+                first_posts = list(islice(iter_json_array(response), 3))
+                post_count = response.headers.get('X-Total-Count', len(first_posts))
+                print(f"✓ Retrieved {post_count} posts")
                 
                 # Show first 3 posts
-                for i, post in enumerate(posts[:3]):
+                for i, post in enumerate(first_posts):
                     print(f"\nPost {i+1}:")
                     print(f"  Title: {post['title']}")
                     print(f"  Body: {post['body'][:50]}...")
                     print(f"  User ID: {post['userId']}")
             
-            # Get specific user info
-            print(f"\nFetching user info for User ID 1...")
-            user_url = "https://jsonplaceholder.typicode.com/users/1"
-            user_response = self.session.get(user_url)
+            response.close()
             
+            # Show specific user info
+            print(f"\nUser info for User ID 1:")
             if user_response.status_code == 200:
-                user = user_response.json()
+                user = parse_json(user_response)
                 print(f"✓ User: {user['name']} ({user['email']})")
                 print(f"  Company: {user['company']['name']}")
                 print(f"  City: {user['address']['city']}")
@@ -200,9 +389,9 @@ class APIExplorer:
         """Demonstrate session usage for multiple requests"""
         print("\n=== Session Demo ===")
         
-        # Create a new session for this demo
-        demo_session = requests.Session()
-        demo_session.headers.update({'X-Demo-Session': 'True'})
+        # Reuse the explorer's session so its pooled connections stay warm;
+        # the demo marker header is sent per request instead
+        demo_headers = {'X-Demo-Session': 'True'}
         
         try:
             # Multiple requests using the same session
@@ -212,43 +401,49 @@ class APIExplorer:
                 "https://httpbin.org/get?request=3"
             ]
             
+            # The requests are independent and the session's connection pool
+            # is thread-safe, so issue them concurrently
             print("Making multiple requests with session...")
-            for i, url in enumerate(urls, 1):
-                response = demo_session.get(url)
+            with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+                responses = list(executor.map(
+                    lambda url: self.get(url, headers=demo_headers), urls))
+            
+            for i, response in enumerate(responses, 1):
                 if response.status_code == 200:
                     print(f"✓ Request {i} successful")
                 else:
                     print(f"✗ Request {i} failed: {response.status_code}")
                 
-                # Small delay between requests
-                time.sleep(0.5)
-                
         except requests.exceptions.RequestException as e:
             print(f"Error: {e}")
-        finally:
-            demo_session.close()
 
-def download_file_demo():
-    """Demonstrate file downloading"""
+def download_file_demo(session, limiter=None):
+    """Demonstrate file downloading over an existing session"""
     print("\n=== File Download Demo ===")
     
     try:
         # Download a small image
         url = "https://httpbin.org/image/png"
-        response = requests.get(url, stream=True)
+        if limiter:
+            limiter.acquire()
+        response = session.get(url, stream=True)
+        response.raise_for_status()  # Don't write an error page to disk
         
-        if response.status_code == 200:
-            filename = "downloaded_image.png"
-            with open(filename, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            print(f"✓ File downloaded: {filename}")
-            print(f"  Content-Type: {response.headers.get('Content-Type')}")
-            print(f"  Size: {len(response.content)} bytes")
-        else:
-            print(f"✗ Download failed: {response.status_code}")
+        # Stream to disk in large chunks without buffering the whole body;
+        # iter_content wraps urllib3 errors in requests exceptions
+        filename = "downloaded_image.png"
+        total = 0
+        with open(filename, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=262144):
+                total += len(chunk)
+                f.write(chunk)
+        
+        print(f"✓ File downloaded: {filename}")
+        print(f"  Content-Type: {response.headers.get('Content-Type')}")
+        print(f"  Size: {total} bytes")
             
+    except requests.exceptions.HTTPError as e:
+        print(f"✗ Download failed: {e}")
     except requests.exceptions.RequestException as e:
         print(f"Error: {e}")
 
@@ -262,13 +457,12 @@ def main():
     # Run all demos
     explorer.basic_get_request()
     explorer.get_with_parameters()
-    explorer.post_request_demo()
-    explorer.json_post_request()
+    explorer.post_demos()
     explorer.headers_and_auth_demo()
     explorer.timeout_and_error_handling()
     explorer.public_api_demo()
     explorer.session_demo()
-    download_file_demo()
+    download_file_demo(explorer.session, explorer.limiter)
     
     print("\n" + "=" * 50)
     print("Requests demonstration completed!")